@@ -1,56 +1,76 @@
 import os
-from typing import Tuple
+from functools import lru_cache
+from typing import Dict, TextIO, Tuple
+
+# Use NumPy to vectorise metadata-driven decryption; fallback to a per-char loop if unavailable
+USE_NUMPY = False
+try:
+    import numpy as np  # type: ignore
+    USE_NUMPY = True
+except Exception:
+    USE_NUMPY = False
 
 ALPHA_LOWER = "abcdefghijklmnopqrstuvwxyz"
 ALPHA_UPPER = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-LOWER_FIRST = set("abcdefghijklm")
-LOWER_SECOND = set("nopqrstuvwxyz")
-UPPER_FIRST = set("ABCDEFGHIJKLM")
-UPPER_SECOND = set("NOPQRSTUVWXYZ")
 
-def _shift_char(c: str, shift: int, alphabet: str) -> str:
-    if c not in alphabet:
+def _shift_char(c: str, shift: int, is_upper: bool) -> str:
+    base = 65 if is_upper else 97
+    idx = ord(c) - base
+    if not 0 <= idx < 26:
         return c
-    n = len(alphabet)
-    idx = alphabet.index(c)
-    return alphabet[(idx + shift) % n]
+    return chr((idx + shift) % 26 + base)
 
 def _encrypt_char(c: str, shift1: int, shift2: int) -> str:
-    if c.islower():
-        if c in LOWER_FIRST:
-            return _shift_char(c, shift1 * shift2, ALPHA_LOWER)
-        elif c in LOWER_SECOND:
-            return _shift_char(c, -(shift1 + shift2), ALPHA_LOWER)
-        else:
-            return c
-    elif c.isupper():
-        if c in UPPER_FIRST:
-            return _shift_char(c, -shift1, ALPHA_UPPER)
-        elif c in UPPER_SECOND:
-            return _shift_char(c, (shift2 ** 2), ALPHA_UPPER)
-        else:
-            return c
+    o = ord(c)
+    if 97 <= o <= 122:
+        return _shift_char(c, shift1 * shift2 if o <= 109 else -(shift1 + shift2), False)
+    elif 65 <= o <= 90:
+        return _shift_char(c, -shift1 if o <= 77 else shift2 ** 2, True)
     else:
         return c
 
 def _decrypt_char(c: str, shift1: int, shift2: int) -> str:
-    if c.islower():
-        cand1 = _shift_char(c, -(shift1 * shift2), ALPHA_LOWER)
-        if cand1 in LOWER_FIRST:
+    o = ord(c)
+    if 97 <= o <= 122:
+        cand1 = _shift_char(c, -(shift1 * shift2), False)
+        if ord(cand1) <= 109:
             return cand1
-        cand2 = _shift_char(c, (shift1 + shift2), ALPHA_LOWER)
-        return cand2
-    elif c.isupper():
-        cand1 = _shift_char(c, shift1, ALPHA_UPPER)
-        if cand1 in UPPER_FIRST:
+        return _shift_char(c, (shift1 + shift2), False)
+    elif 65 <= o <= 90:
+        cand1 = _shift_char(c, shift1, True)
+        if ord(cand1) <= 77:
             return cand1
-        cand2 = _shift_char(c, -(shift2 ** 2), ALPHA_UPPER)
-        return cand2
+        return _shift_char(c, -(shift2 ** 2), True)
     else:
         return c
 
+class _MetaTable(dict):
+    """Translation table that maps every unlisted character to the '0' meta code."""
+
+    def __missing__(self, key: int) -> int:
+        return ord('0')
+
+@lru_cache(maxsize=64)
+def _build_tables(shift1: int, shift2: int) -> Tuple[Dict[int, str], Dict[int, str], bytes, _MetaTable]:
+    """Precompute translation tables for a (shift1, shift2) pair.
+
+    Returns (enc_table, dec_table, meta_bytes, meta_table): the str.translate
+    tables for encryption and decryption, a 256-byte table for ASCII meta
+    generation via bytes.translate, and a str.translate meta table whose
+    unmapped characters default to '0'.
+    """
+    letters = ALPHA_LOWER + ALPHA_UPPER
+    enc_table = str.maketrans({c: _encrypt_char(c, shift1, shift2) for c in letters})
+    dec_table = str.maketrans({c: _decrypt_char(c, shift1, shift2) for c in letters})
+    codes = {c: 'l' if c <= 'm' else 'L' for c in ALPHA_LOWER}
+    codes.update({c: 'u' if c <= 'M' else 'U' for c in ALPHA_UPPER})
+    meta_bytes = bytes(ord(codes.get(chr(i), '0')) for i in range(256))
+    meta_table = _MetaTable((ord(c), ord(m)) for c, m in codes.items())
+    return enc_table, dec_table, meta_bytes, meta_table
+
 def encrypt_text(text: str, shift1: int, shift2: int) -> str:
-    return "".join(_encrypt_char(c, shift1, shift2) for c in text)
+    enc_table, _, _, _ = _build_tables(shift1, shift2)
+    return text.translate(enc_table)
 
 def encrypt_text_with_meta(text: str, shift1: int, shift2: int) -> Tuple[str, str]:
     """Return encrypted text and sidecar metadata marking which rule was applied per char.
@@ -62,55 +82,93 @@ def encrypt_text_with_meta(text: str, shift1: int, shift2: int) -> Tuple[str, st
     - 'U': original uppercase in N-Z (shift forward by shift2**2)
     - '0': non-alphabetic (unchanged)
     """
-    encrypted_chars = []
-    meta_chars = []
-    for c in text:
-        if c.islower():
-            if c in LOWER_FIRST:
-                encrypted_chars.append(_shift_char(c, shift1 * shift2, ALPHA_LOWER))
-                meta_chars.append('l')
-            elif c in LOWER_SECOND:
-                encrypted_chars.append(_shift_char(c, -(shift1 + shift2), ALPHA_LOWER))
-                meta_chars.append('L')
-            else:
-                encrypted_chars.append(c)
-                meta_chars.append('0')
-        elif c.isupper():
-            if c in UPPER_FIRST:
-                encrypted_chars.append(_shift_char(c, -shift1, ALPHA_UPPER))
-                meta_chars.append('u')
-            elif c in UPPER_SECOND:
-                encrypted_chars.append(_shift_char(c, (shift2 ** 2), ALPHA_UPPER))
-                meta_chars.append('U')
-            else:
-                encrypted_chars.append(c)
-                meta_chars.append('0')
-        else:
-            encrypted_chars.append(c)
-            meta_chars.append('0')
-    return "".join(encrypted_chars), "".join(meta_chars)
+    enc_table, _, meta_bytes, meta_table = _build_tables(shift1, shift2)
+    if text.isascii():
+        meta = text.encode("ascii").translate(meta_bytes).decode("ascii")
+    else:
+        meta = text.translate(meta_table)
+    return text.translate(enc_table), meta
 
 def decrypt_text(text: str, shift1: int, shift2: int) -> str:
-    return "".join(_decrypt_char(c, shift1, shift2) for c in text)
+    _, dec_table, _, _ = _build_tables(shift1, shift2)
+    return text.translate(dec_table)
+
+# Inputs at least this long use the Numba kernel in encrypt_jit when it is available
+JIT_MIN_CHARS = 1 << 20
+
+@lru_cache(maxsize=1)
+def _jit_decoder():
+    """Lazily import the Numba decoder so short runs don't pay its import cost."""
+    try:
+        from encrypt_jit import decrypt_ascii_with_meta
+    except Exception:
+        return None
+    return decrypt_ascii_with_meta
+
+def _decrypt_np(ciphertext: str, metadata: str, shift1: int, shift2: int) -> str:
+    """Vectorised decrypt_text_with_meta for ASCII ciphertext and metadata."""
+    c = np.frombuffer(ciphertext.encode("ascii"), dtype=np.uint8).astype(np.int16)
+    m = np.frombuffer(metadata.encode("ascii"), dtype=np.uint8)
+    lower = (c >= 97) & (c <= 122)
+    upper = (c >= 65) & (c <= 90)
+    conds = [
+        (m == ord('l')) & lower,
+        (m == ord('L')) & lower,
+        (m == ord('u')) & upper,
+        (m == ord('U')) & upper,
+    ]
+    # Reduce shifts mod 26 up front so the int16 arithmetic cannot overflow
+    choices = [
+        (c - 97 + (-(shift1 * shift2)) % 26) % 26 + 97,
+        (c - 97 + (shift1 + shift2) % 26) % 26 + 97,
+        (c - 65 + shift1 % 26) % 26 + 65,
+        (c - 65 + (-(shift2 ** 2)) % 26) % 26 + 65,
+    ]
+    out = np.select(conds, choices, default=c)
+    return out.astype(np.uint8).tobytes().decode("ascii")
 
 def decrypt_text_with_meta(ciphertext: str, metadata: str, shift1: int, shift2: int) -> str:
     """Deterministically decrypt using sidecar metadata produced during encryption."""
     if len(ciphertext) != len(metadata):
         raise ValueError("Ciphertext and metadata lengths do not match")
+    if USE_NUMPY and ciphertext.isascii() and metadata.isascii():
+        if len(ciphertext) >= JIT_MIN_CHARS:
+            decrypt_ascii_with_meta = _jit_decoder()
+            if decrypt_ascii_with_meta is not None:
+                return decrypt_ascii_with_meta(ciphertext, metadata, shift1, shift2)
+        return _decrypt_np(ciphertext, metadata, shift1, shift2)
+    shift_l = -(shift1 * shift2)
+    shift_L = shift1 + shift2
+    shift_U = -(shift2 ** 2)
     result_chars = []
     for c, m in zip(ciphertext, metadata):
         if m == 'l':
-            result_chars.append(_shift_char(c, -(shift1 * shift2), ALPHA_LOWER))
+            result_chars.append(_shift_char(c, shift_l, False))
         elif m == 'L':
-            result_chars.append(_shift_char(c, (shift1 + shift2), ALPHA_LOWER))
+            result_chars.append(_shift_char(c, shift_L, False))
         elif m == 'u':
-            result_chars.append(_shift_char(c, shift1, ALPHA_UPPER))
+            result_chars.append(_shift_char(c, shift1, True))
         elif m == 'U':
-            result_chars.append(_shift_char(c, -(shift2 ** 2), ALPHA_UPPER))
+            result_chars.append(_shift_char(c, shift_U, True))
         else:
             result_chars.append(c)
     return "".join(result_chars)
 
+# Characters per chunk when streaming encrypt_file
+CHUNK_CHARS = 1 << 20
+# Buffer size for the cipher file I/O (128 KiB)
+BUFSZ = 1 << 17
+
+def _open(path: str, mode: str) -> TextIO:
+    """Open a UTF-8 text file with a BUFSZ buffer and hint sequential access where supported."""
+    f = open(path, mode, encoding="utf-8", buffering=BUFSZ)
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+    return f
+
 def _paths() -> Tuple[str, str, str, str]:
     base = os.path.dirname(os.path.abspath(__file__))
     raw_path = os.path.join(base, "raw_text.txt")
@@ -121,31 +179,30 @@ def _paths() -> Tuple[str, str, str, str]:
 
 def encrypt_file(shift1: int, shift2: int) -> None:
     raw_path, enc_path, _, meta_path = _paths()
-    with open(raw_path, "r", encoding="utf-8") as f:
-        raw = f.read()
-    enc, meta = encrypt_text_with_meta(raw, shift1, shift2)
-    with open(enc_path, "w", encoding="utf-8") as f:
-        f.write(enc)
-    with open(meta_path, "w", encoding="utf-8") as f:
-        f.write(meta)
+    # Stream in chunks so only one chunk of text, ciphertext and metadata is held at a time
+    with _open(raw_path, "r") as fi, _open(enc_path, "w") as fo, _open(meta_path, "w") as fm:
+        while chunk := fi.read(CHUNK_CHARS):
+            enc, meta = encrypt_text_with_meta(chunk, shift1, shift2)
+            fo.write(enc)
+            fm.write(meta)
     print(f"Encrypted -> {enc_path}")
 
 def decrypt_file(shift1: int, shift2: int) -> None:
     _, enc_path, dec_path, meta_path = _paths()
-    with open(enc_path, "r", encoding="utf-8") as f:
+    with _open(enc_path, "r") as f:
         enc = f.read()
-    with open(meta_path, "r", encoding="utf-8") as f:
+    with _open(meta_path, "r") as f:
         meta = f.read()
     dec = decrypt_text_with_meta(enc, meta, shift1, shift2)
-    with open(dec_path, "w", encoding="utf-8") as f:
+    with _open(dec_path, "w") as f:
         f.write(dec)
     print(f"Decrypted -> {dec_path}")
 
 def verify_decryption() -> bool:
     raw_path, _, dec_path, _ = _paths()
-    with open(raw_path, "r", encoding="utf-8") as f:
+    with _open(raw_path, "r") as f:
         raw = f.read()
-    with open(dec_path, "r", encoding="utf-8") as f:
+    with _open(dec_path, "r") as f:
         dec = f.read()
     ok = raw == dec
     print("Verification:", "SUCCESS" if ok else "FAILURE")
@@ -0,0 +1,40 @@
+"""Numba-compiled ASCII fast path for encrypt.decrypt_text_with_meta.
+
+Importing this module requires NumPy and Numba; encrypt.py falls back to
+its NumPy or pure-Python paths when either is unavailable.
+"""
+import numpy as np
+from numba import njit, prange
+
+@njit(parallel=True, cache=True)
+def _dec(buf, meta, s_l, s_L, s_u, s_U, out):
+    # s_* are the per-code decryption shifts already reduced to 0..25
+    for i in prange(buf.size):
+        b = buf[i]
+        m = meta[i]
+        if m == 108 and 97 <= b <= 122:  # 'l'
+            out[i] = (b - 97 + s_l) % 26 + 97
+        elif m == 76 and 97 <= b <= 122:  # 'L'
+            out[i] = (b - 97 + s_L) % 26 + 97
+        elif m == 117 and 65 <= b <= 90:  # 'u'
+            out[i] = (b - 65 + s_u) % 26 + 65
+        elif m == 85 and 65 <= b <= 90:  # 'U'
+            out[i] = (b - 65 + s_U) % 26 + 65
+        else:
+            out[i] = b
+
+def decrypt_ascii_with_meta(ciphertext: str, metadata: str, shift1: int, shift2: int) -> str:
+    """Decrypt ASCII ciphertext/metadata of equal length; same result as the Python loop."""
+    buf = np.frombuffer(ciphertext.encode("ascii"), dtype=np.uint8)
+    meta = np.frombuffer(metadata.encode("ascii"), dtype=np.uint8)
+    out = np.empty_like(buf)
+    _dec(
+        buf,
+        meta,
+        (-(shift1 * shift2)) % 26,
+        (shift1 + shift2) % 26,
+        shift1 % 26,
+        (-(shift2 ** 2)) % 26,
+        out,
+    )
+    return out.tobytes().decode("ascii")
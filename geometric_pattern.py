@@ -1,63 +1,152 @@
 import turtle
 import math
+from functools import lru_cache
+from itertools import accumulate
+
+# Use NumPy to compute the outline coordinates; fallback to pure Python if unavailable
+USE_NUMPY = False
+try:
+    import numpy as np  # type: ignore
+    USE_NUMPY = True
+except Exception:
+    USE_NUMPY = False
+
+# Pillow is only needed to save the pattern as an image
+USE_PIL = False
+try:
+    from PIL import Image, ImageDraw  # type: ignore
+    USE_PIL = True
+except Exception:
+    USE_PIL = False
+
+@lru_cache(maxsize=None)
+def turn_sequence(depth):
+    """
+    Build the turns of a pattern edge as a flat tuple, without recursion.
+
+    An edge of the given depth is 4**depth equal segments; the returned
+    tuple holds the turn (degrees, positive = left) made between each pair
+    of consecutive segments, so it has 4**depth - 1 entries.
+
+    Args:
+        depth: recursion depth for pattern generation
+    """
+    # Each level replaces every segment F with F +60 F -120 F +60 F
+    sub = (60, -120, 60)
+    turns = ()
+    for _ in range(depth):
+        expanded = list(sub)
+        for turn in turns:
+            expanded.append(turn)
+            expanded.extend(sub)
+        turns = tuple(expanded)
+    return turns
 
 def draw_recursive_edge(t, length, depth):
     """
-    Recursively draw an edge with geometric pattern modifications.
+    Draw an edge with geometric pattern modifications.
+
+    Replays the precomputed turn sequence instead of recursing, so the
+    work per edge is a single loop over 4**depth segments.
 
     Args:
         t: turtle object
-        length: length of the current edge
-        depth: current recursion depth
+        length: length of the full edge
+        depth: recursion depth
     """
-    if depth == 0:
-        # Base case: draw a straight line
-        t.forward(length)
-    else:
-        # Divide edge into three equal segments
-        segment_length = length / 3
-
-        # Draw first segment
-        draw_recursive_edge(t, segment_length, depth - 1)
+    unit = length / (3 ** depth)
+    t.forward(unit)
+    for angle in turn_sequence(depth):
+        t.left(angle)
+        t.forward(unit)
 
-        # Turn left 60 degrees and draw first side of equilateral triangle
-        t.left(60)
-        draw_recursive_edge(t, segment_length, depth - 1)
-
-        # Turn right 120 degrees and draw second side of equilateral triangle
-        t.right(120)
-        draw_recursive_edge(t, segment_length, depth - 1)
+def pattern_points(num_sides, side_length, depth, start=(0.0, 0.0)):
+    """
+    Compute the outline of the full pattern as a list of (x, y) points.
 
-        # Turn left 60 degrees to return to original direction
-        t.left(60)
+    The turtle starts at `start` facing east and turns right by
+    360 / num_sides after each edge, matching the turtle drawing.
 
-        # Draw the last segment
-        draw_recursive_edge(t, segment_length, depth - 1)
+    Args:
+        num_sides: number of sides of the initial polygon
+        side_length: length of each edge in pixels
+        depth: recursion depth for pattern generation
+        start: starting (x, y) position
+    """
+    turns = turn_sequence(depth)
+    unit = side_length / (3 ** depth)
+    angle = 360 / num_sides
+    x0, y0 = start
+
+    if USE_NUMPY:
+        # Heading of every segment: turns within an edge plus the polygon turn per edge
+        edge = np.concatenate(([0.0], np.cumsum(turns, dtype=float)))
+        headings = np.radians((edge[None, :] - angle * np.arange(num_sides)[:, None]).ravel())
+        xs = x0 + np.concatenate(([0.0], np.cumsum(unit * np.cos(headings))))
+        ys = y0 + np.concatenate(([0.0], np.cumsum(unit * np.sin(headings))))
+        return list(zip(xs.tolist(), ys.tolist()))
+
+    edge = list(accumulate(turns, initial=0))
+    points = [(x0, y0)]
+    x, y = x0, y0
+    for k in range(num_sides):
+        for h in edge:
+            rad = math.radians(h - angle * k)
+            x += unit * math.cos(rad)
+            y += unit * math.sin(rad)
+            points.append((x, y))
+    return points
 
 def draw_geometric_pattern(num_sides, side_length, depth):
     """
     Draw a complete geometric pattern with the specified parameters.
 
+    The outline is computed up front and drawn as one canvas polyline,
+    rather than one turtle move (and Tk update) per segment.
+
     Args:
         num_sides: number of sides of the initial polygon
         side_length: length of each edge in pixels
         depth: recursion depth for pattern generation
     """
-    # Set up the turtle
-    t = turtle.Turtle()
-    t.speed(0)  # Fastest speed
-    t.pensize(2)
+    screen = turtle.Screen()
+    screen.tracer(0, 0)
 
-    # Calculate the angle for the polygon
-    angle = 360 / num_sides
+    # Turtle y points up, the Tk canvas y points down
+    coords = []
+    for x, y in pattern_points(num_sides, side_length, depth):
+        coords.append(x)
+        coords.append(-y)
+    screen.getcanvas().create_line(*coords, width=2, fill="black")
+    screen.update()
 
-    # Draw the polygon with recursive edges
-    for _ in range(num_sides):
-        draw_recursive_edge(t, side_length, depth)
-        t.right(angle)
+def render_pillow(num_sides, side_length, depth, path, margin=50):
+    """
+    Render the pattern straight to an image file with Pillow, bypassing turtle.
 
-    # Hide the turtle when done
-    t.hideturtle()
+    Args:
+        num_sides: number of sides of the initial polygon
+        side_length: length of each edge in pixels
+        depth: recursion depth for pattern generation
+        path: output image path; the format follows the file extension
+        margin: blank border around the pattern in pixels
+    """
+    if not USE_PIL:
+        raise RuntimeError("Pillow is required to render the pattern to an image")
+
+    points = pattern_points(num_sides, side_length, depth)
+    min_x = min(x for x, _ in points)
+    max_x = max(x for x, _ in points)
+    min_y = min(y for _, y in points)
+    max_y = max(y for _, y in points)
+    width = int(math.ceil(max_x - min_x)) + 2 * margin
+    height = int(math.ceil(max_y - min_y)) + 2 * margin
+
+    # Image y points down, so flip around the top of the pattern
+    coords = [(x - min_x + margin, max_y - y + margin) for x, y in points]
+    img = Image.new("RGB", (width, height), "white")
+    ImageDraw.Draw(img).line(coords, fill="black", width=2)
+    img.save(path)
 
 def main():
     """
@@ -87,6 +176,16 @@ def main():
         print("Error: Please enter valid numbers")
         return
 
+    # Optionally save to an image instead of opening a turtle window
+    image_path = input("Enter an image file to save to (leave blank to display): ").strip()
+    if image_path:
+        if not USE_PIL:
+            print("Error: Saving to an image requires Pillow")
+            return
+        render_pillow(num_sides, side_length, depth, image_path)
+        print(f"\nPattern saved to {image_path}")
+        return
+
     # Set up the screen
     screen = turtle.Screen()
     screen.title(f"Geometric Pattern - {num_sides} sides, depth {depth}")
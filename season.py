@@ -1,14 +1,18 @@
 #!/usr/bin/env python3
 import os
+import re
 import csv
 import math
-from collections import defaultdict
-from statistics import pstdev
+from array import array
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 
 # Try pandas for flexible parsing; fallback to csv if unavailable
 USE_PANDAS = False
 try:
+    import numpy as np  # type: ignore
     import pandas as pd  # type: ignore
     USE_PANDAS = True
 except Exception:
@@ -21,12 +25,23 @@ OUT_AVG = os.path.join(WORKDIR, "average_temp.txt")
 OUT_RANGE = os.path.join(WORKDIR, "largest_temp_range_station.txt")
 OUT_STAB = os.path.join(WORKDIR, "temperature_stability_stations.txt")
 
+# Columnar (SoA) observations: unique station names plus parallel per-record arrays.
+# The arrays are NumPy arrays with pandas, stdlib arrays otherwise; station_ids are
+# int32, months int8 and temps float32.
+Records = namedtuple("Records", ["stations", "station_ids", "months", "temps"])
+
+# Tolerance for treating two stations' range/std dev as tied; float32 temps carry ~1e-6 noise
+TIE_TOL = 1e-4
+
 SEASON_BY_MONTH = {
     12: "Summer", 1: "Summer", 2: "Summer",
     3: "Autumn", 4: "Autumn", 5: "Autumn",
     6: "Winter", 7: "Winter", 8: "Winter",
     9: "Spring", 10: "Spring", 11: "Spring",
 }
+SEASON_NAMES = ["Summer", "Autumn", "Winter", "Spring"]
+# Season index (into SEASON_NAMES) for months 1-12; index 0 is unused
+MONTH_TO_SEASON = [0] + [SEASON_NAMES.index(SEASON_BY_MONTH[m]) for m in range(1, 13)]
 
 # Accepted column name variants (lowercased)
 STATION_COLS = {"station", "station_id", "station name", "station_name", "id", "site", "site_name", "site id", "siteid"}
@@ -59,6 +74,26 @@ def safe_float(x):
     except Exception:
         return None
 
+# Common date shapes matched up front so month_from_any rarely needs the strptime loop
+RE_YMD = re.compile(r"(\d{4})([-/])(\d{1,2})\2(\d{1,2})(?: (\d{1,2}):(\d{1,2}):(\d{1,2}))?")
+RE_DMY = re.compile(r"(\d{1,2})([-/])(\d{1,2})\2(\d{4})")
+RE_YM = re.compile(r"(\d{4})[-/](\d{1,2})")
+RE_MY = re.compile(r"(\d{1,2})/(\d{4})")
+RE_NAMED = re.compile(r"(?:(\d{1,2})\s+)?([A-Za-z]+)\s+(\d{4})")
+
+# Month names strptime accepts for %b/%B ("sept" is not one of them)
+STRPTIME_MONTHS = {k: v for k, v in MONTH_NAME_TO_NUM.items() if k != "sept"}
+
+DATE_FMTS = [
+    "%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y",
+    "%Y/%m/%d", "%d-%m-%Y", "%m-%d-%Y",
+    "%Y-%m-%d %H:%M:%S", "%Y/%m/%d %H:%M:%S",
+    "%Y-%m", "%Y/%m", "%m/%Y",
+    "%d %b %Y", "%d %B %Y",
+    "%b %Y", "%B %Y",
+    "%Y%m%d",
+]
+
 def month_from_any(date_val):
     # Accepts str/datetime/int/month-name
     if date_val is None:
@@ -70,7 +105,43 @@ def month_from_any(date_val):
         if 1 <= m <= 12:
             return m
         return None
-    s = str(date_val).strip()
+    return month_from_str(str(date_val).strip())
+
+def valid_month(*args):
+    # Month of datetime(*args), or None if the fields don't form a real date
+    try:
+        return datetime(*args).month
+    except ValueError:
+        return None
+
+def fast_month(s):
+    # Regex fast path; returns the same month the first matching DATE_FMTS entry would, else None
+    m = RE_YMD.fullmatch(s)
+    if m:
+        y, _, mo, d, hh, mi, ss = m.groups()
+        if hh is None:
+            return valid_month(int(y), int(mo), int(d))
+        return valid_month(int(y), int(mo), int(d), int(hh), int(mi), int(ss))
+    m = RE_DMY.fullmatch(s)
+    if m:
+        a, _, b, y = m.groups()
+        # Day-first formats are tried before month-first ones
+        return valid_month(int(y), int(b), int(a)) or valid_month(int(y), int(a), int(b))
+    m = RE_YM.fullmatch(s) or RE_MY.fullmatch(s)
+    if m:
+        mo = int(m.group(2) if len(m.group(1)) == 4 else m.group(1))
+        return mo if 1 <= mo <= 12 else None
+    m = RE_NAMED.fullmatch(s)
+    if m:
+        d, name, y = m.groups()
+        mo = STRPTIME_MONTHS.get(name.lower())
+        if mo is None:
+            return None
+        return mo if d is None else valid_month(int(y), mo, int(d))
+    return None
+
+@lru_cache(maxsize=4096)
+def month_from_str(s):
     if not s:
         return None
 
@@ -85,17 +156,12 @@ def month_from_any(date_val):
     if key in MONTH_NAME_TO_NUM:
         return MONTH_NAME_TO_NUM[key]
 
+    m = fast_month(s)
+    if m is not None:
+        return m
+
     # Try common date formats
-    fmts = [
-        "%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y",
-        "%Y/%m/%d", "%d-%m-%Y", "%m-%d-%Y",
-        "%Y-%m-%d %H:%M:%S", "%Y/%m/%d %H:%M:%S",
-        "%Y-%m", "%Y/%m", "%m/%Y",
-        "%d %b %Y", "%d %B %Y",
-        "%b %Y", "%B %Y",
-        "%Y%m%d",
-    ]
-    for fmt in fmts:
+    for fmt in DATE_FMTS:
         try:
             dt = datetime.strptime(s, fmt)
             return dt.month
@@ -128,54 +194,83 @@ def guess_temp_col(headers):
         return sorted(priority, key=len)[0]
     return None
 
+def col_index(headers, name):
+    # Position of a picked column; the last duplicate wins, as it did with DictReader
+    if name is None:
+        return None
+    return max(i for i, h in enumerate(headers) if h == name)
+
+def cell(row, idx):
+    # Positional field access; short rows yield None like DictReader's restval
+    if idx is None or idx >= len(row):
+        return None
+    return row[idx]
+
 def read_rows_with_csv(path):
-    out = []
+    # Returns parallel (stations, months, temps) lists
+    out = ([], [], [])
     with open(path, "r", newline="", encoding="utf-8") as f:
-        sniffer = csv.Sniffer()
-        sample = f.read(2048)
+        # A comma in the header means a plain CSV; only sniff files that don't look like one
+        header_line = f.readline()
         f.seek(0)
-        try:
-            dialect = sniffer.sniff(sample)
-        except Exception:
+        if "," in header_line:
             dialect = csv.excel
-        reader = csv.DictReader(f, dialect=dialect)
-        if reader.fieldnames is None:
+        else:
+            sample = f.read(2048)
+            f.seek(0)
+            try:
+                dialect = csv.Sniffer().sniff(sample)
+            except Exception:
+                dialect = csv.excel
+        reader = csv.reader(f, dialect=dialect)
+        fieldnames = next(reader, None)
+        if fieldnames is None:
+            return out
+        headers = normalize_headers(fieldnames)
+        station_idx = col_index(headers, pick_col(headers, STATION_COLS))
+        temp_idx = col_index(headers, pick_col(headers, TEMP_COLS) or guess_temp_col(headers))
+        date_idx = col_index(headers, pick_col(headers, DATE_COLS))
+        year_idx = col_index(headers, pick_col(headers, YEAR_COLS))
+        month_idx = col_index(headers, pick_col(headers, MONTH_COLS))
+
+        if temp_idx is None:
             return out
-        headers = normalize_headers(reader.fieldnames)
-        colmap = {orig: norm for orig, norm in zip(reader.fieldnames, headers)}
-        station_col = pick_col(headers, STATION_COLS)
-        temp_col = pick_col(headers, TEMP_COLS) or guess_temp_col(headers)
-        date_col = pick_col(headers, DATE_COLS)
-        year_col = pick_col(headers, YEAR_COLS)
-        month_col = pick_col(headers, MONTH_COLS)
-
         for row in reader:
-            # Normalize keys
-            row = {colmap.get(k, k): v for k, v in row.items()}
-            station = row.get(station_col) if station_col else None
-            if station is None or str(station).strip() == "":
-                station = None
-            temp = safe_float(row.get(temp_col)) if temp_col else None
+            if not row:
+                continue  # blank line
+            temp = safe_float(cell(row, temp_idx))
             if temp is None:
                 continue  # ignore missing temperature values
+            station = cell(row, station_idx)
+            if station is None or station.strip() == "":
+                station = None
             m = None
-            if date_col:
-                m = month_from_any(row.get(date_col))
-            if m is None and (year_col and month_col):
-                m = month_from_any(row.get(month_col))
-            if m is None and month_col:
-                m = month_from_any(row.get(month_col))
+            if date_idx is not None:
+                m = month_from_any(cell(row, date_idx))
+            if m is None and (year_idx is not None and month_idx is not None):
+                m = month_from_any(cell(row, month_idx))
+            if m is None and month_idx is not None:
+                m = month_from_any(cell(row, month_idx))
             if m is None:
                 continue
-            out.append((station, m, temp))
+            out[0].append(station)
+            out[1].append(m)
+            out[2].append(temp)
     return out
 
+def months_by_category(values):
+    # month_from_any once per distinct value, mapped back through the category codes (0 = no month)
+    cat = pd.Categorical(values)
+    # Trailing 0 is picked up by code -1 (missing values)
+    month_map = np.array([month_from_any(u) or 0 for u in cat.categories] + [0], dtype=np.int8)
+    return pd.Series(month_map[cat.codes], index=values.index)
+
 def read_rows_with_pandas(path):
-    df = pd.read_csv(path)
-    if df.empty:
-        return []
-    cols = [c.strip().lower() for c in df.columns]
-    colmap = {orig: norm for orig, norm in zip(df.columns, cols)}
+    # Returns parallel (stations, months, temps) arrays
+    # Read only the header first, so the full parse can be limited to the columns we use
+    header = pd.read_csv(path, nrows=0)
+    cols = [c.strip().lower() for c in header.columns]
+    colmap = {orig: norm for orig, norm in zip(header.columns, cols)}
     station_col = next((c for c in cols if c in STATION_COLS), None)
     temp_col = next((c for c in cols if c in TEMP_COLS), None) or guess_temp_col(cols)
     date_col = next((c for c in cols if c in DATE_COLS), None)
@@ -183,42 +278,52 @@ def read_rows_with_pandas(path):
     year_col = next((c for c in cols if c in YEAR_COLS), None)
 
     if temp_col is None:
-        return []
+        return [], [], []
+
+    usecols = [colmap_inv(colmap, c) for c in (station_col, temp_col, date_col, month_col) if c]
+    df = pd.read_csv(path, usecols=usecols, engine="c", low_memory=False)
+    if df.empty:
+        return [], [], []
 
     # Drop NaN temps
-    tseries = pd.to_numeric(df[colmap_inv(colmap, temp_col)], errors="coerce")
+    # float32 is ample for 0.1°C readings and halves the memory every reduction touches
+    tseries = pd.to_numeric(df[colmap_inv(colmap, temp_col)], errors="coerce").astype(np.float32)
     df = df.assign(_temp=tseries).dropna(subset=["_temp"])
 
-    # Month extraction
+    # Month extraction, vectorised over the whole column
     m = None
     if date_col:
         dc = colmap_inv(colmap, date_col)
         try:
-            dts = pd.to_datetime(df[dc], errors="coerce", dayfirst=True, infer_datetime_format=True)
-            m = dts.dt.month
+            m = pd.to_datetime(df[dc], errors="coerce", format="ISO8601").dt.month
+            # Only non-ISO dates fall back to month_from_any
+            rest = m.isna() & df[dc].notna()
+            if rest.any():
+                m[rest] = months_by_category(df.loc[rest, dc])
         except Exception:
             m = None
     if m is None and month_col:
         mc = colmap_inv(colmap, month_col)
-        m = df[mc].apply(month_from_any)
-    if m is None and (year_col and month_col):
-        mc = colmap_inv(colmap, month_col)
-        m = df[mc].apply(month_from_any)
+        if pd.api.types.is_numeric_dtype(df[mc]):
+            m = df[mc]
+        else:
+            m = months_by_category(df[mc])
     if m is None:
-        return []
+        return [], [], []
+
+    month = pd.to_numeric(m, errors="coerce")
+    valid = month.between(1, 12)
+    month = month[valid].astype("int8")
+    temps = df.loc[valid, "_temp"]
 
     if station_col:
         sc = colmap_inv(colmap, station_col)
-        station_vals = df[sc].astype(str).where(df[sc].notna(), None)
+        st = df.loc[valid, sc]
+        station_vals = st.astype(str).astype(object).where(st.notna(), None).to_numpy()
     else:
-        station_vals = [None] * len(df)
+        station_vals = np.full(len(temps), None, dtype=object)
 
-    out = []
-    for station, month, temp in zip(station_vals, m, df["_temp"].astype(float)):
-        if month is None or not (1 <= int(month) <= 12):
-            continue
-        out.append((station, int(month), float(temp)))
-    return out
+    return station_vals, month.to_numpy(), temps.to_numpy()
 
 def colmap_inv(colmap, value):
     # find original column for normalized name
@@ -227,135 +332,220 @@ def colmap_inv(colmap, value):
             return k
     return value
 
-def load_all_records():
-    records = []  # list of (station:str|None, month:int, temp:float)
-    if not os.path.isdir(TEMP_DIR):
-        print(f"Directory not found: {TEMP_DIR}")
-        return records
-    files = [os.path.join(TEMP_DIR, f) for f in os.listdir(TEMP_DIR) if f.lower().endswith(".csv")]
-    files.sort()
-    print(f"Found {len(files)} CSV files in {TEMP_DIR}")
-    for path in files:
-        try:
-            if USE_PANDAS:
-                rows = read_rows_with_pandas(path)
-            else:
-                rows = read_rows_with_csv(path)
-            print(f"  {os.path.basename(path)}: {len(rows)} records")
-            records.extend(rows)
-        except Exception as e:
-            print(f"  Error reading {os.path.basename(path)}: {e}")
-            continue
-    return records
+def make_records(parts):
+    # Concatenate per-file (stations, months, temps) columns and factorize stations (None → "Unknown")
+    if USE_PANDAS:
+        if not parts:
+            return Records([], np.empty(0, np.int32), np.empty(0, np.int8), np.empty(0, np.float32))
+        keys = pd.Series(np.concatenate([p[0] for p in parts]), dtype=object)
+        keys = keys.str.strip().fillna("").replace("", "Unknown")
+        codes, uniques = pd.factorize(keys)
+        months = np.concatenate([p[1] for p in parts]).astype(np.int8)
+        temps = np.concatenate([p[2] for p in parts]).astype(np.float32)
+        return Records(list(uniques), codes.astype(np.int32), months, temps)
+
+    ids = {}
+    station_ids = array("i")
+    months = array("b")
+    temps = array("f")
+    for stations, ms, ts in parts:
+        for station in stations:
+            key = (station.strip() if isinstance(station, str) else station) or "Unknown"
+            station_ids.append(ids.setdefault(key, len(ids)))
+        months.extend(ms)
+        temps.extend(ts)
+    return Records(list(ids), station_ids, months, temps)
 
 def format_celsius(x):
     return f"{x:.1f}°C"
 
-def compute_seasonal_average(records):
-    by_season = defaultdict(list)
-    for station, month, temp in records:
-        season = SEASON_BY_MONTH.get(month)
-        if season:
-            by_season[season].append(temp)
-    result = {}
-    for season in ["Summer", "Autumn", "Winter", "Spring"]:
-        vals = by_season.get(season, [])
-        if vals:
-            avg = sum(vals) / len(vals)
-            result[season] = avg
-    return result
-
-def compute_station_stats(records):
-    # Aggregate per station (None → "Unknown")
-    temps_by_station = defaultdict(list)
-    for station, month, temp in records:
-        key = (station.strip() if isinstance(station, str) else station) or "Unknown"
-        temps_by_station[key].append(temp)
-
-    # Range
+def update_welford(s, temp):
+    # s = [count, mean, M2, tmin, tmax], updated in place with Welford's online algorithm
+    s[0] += 1
+    d = temp - s[1]
+    s[1] += d / s[0]
+    s[2] += d * (temp - s[1])
+    if temp < s[3]:
+        s[3] = temp
+    if temp > s[4]:
+        s[4] = temp
+
+def summarize_stations(stats):
+    # Range and population std dev per station from the Welford accumulators
     range_info = {}
-    for st, vals in temps_by_station.items():
-        if not vals:
-            continue
-        tmax = max(vals)
-        tmin = min(vals)
-        rng = tmax - tmin
-        range_info[st] = (rng, tmax, tmin)
-
-    # Stability via population std dev (pstdev). If only one value, stddev = 0.0
     std_info = {}
-    for st, vals in temps_by_station.items():
-        if len(vals) == 0:
-            continue
-        if len(vals) == 1:
-            std = 0.0
-        else:
-            std = pstdev(vals)
-        std_info[st] = std
-
-    return temps_by_station, range_info, std_info
-
-def write_seasonal_average(avg_by_season):
-    lines = []
-    for season in ["Summer", "Autumn", "Winter", "Spring"]:
-        if season in avg_by_season:
-            lines.append(f"{season}: {format_celsius(avg_by_season[season])}")
-    with open(OUT_AVG, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+    for st, (n, mean, m2, tmin, tmax) in stats.items():
+        range_info[st] = (tmax - tmin, tmax, tmin)
+        # If only one value, stddev = 0.0
+        std_info[st] = math.sqrt(m2 / n) if n > 1 else 0.0
+    return range_info, std_info
+
+def merge_welford(a, b):
+    # Combine two [count, mean, M2, tmin, tmax] accumulators (Chan et al. parallel variance)
+    n = a[0] + b[0]
+    d = b[1] - a[1]
+    return [
+        n,
+        a[1] + d * b[0] / n,
+        a[2] + b[2] + d * d * a[0] * b[0] / n,
+        min(a[3], b[3]),
+        max(a[4], b[4]),
+    ]
 
-def write_largest_range(range_info):
+def compute_partial_np(records):
+    # Vectorised compute_partial over the NumPy arrays in records
+    ids, months, temps = records.station_ids, records.months, records.temps
+    n_st = len(records.stations)
+
+    # Seasons: map months to season ids, then one bincount for sums and counts
+    season_ids = np.asarray(MONTH_TO_SEASON, dtype=np.int8)[months]
+    season_sums = np.bincount(season_ids, weights=temps, minlength=len(SEASON_NAMES))
+    season_counts = np.bincount(season_ids, minlength=len(SEASON_NAMES))
+
+    # Per-station count, mean, M2, min and max (bincount sums the float32 temps in float64)
+    counts = np.bincount(ids, minlength=n_st)
+    means = np.bincount(ids, weights=temps, minlength=n_st) / counts
+    m2 = np.bincount(ids, weights=(temps - means[ids]) ** 2, minlength=n_st)
+    tmin = np.full(n_st, np.inf, dtype=np.float32)
+    tmax = np.full(n_st, -np.inf, dtype=np.float32)
+    np.minimum.at(tmin, ids, temps)
+    np.maximum.at(tmax, ids, temps)
+
+    stats = {
+        st: [int(counts[i]), float(means[i]), float(m2[i]), float(tmin[i]), float(tmax[i])]
+        for i, st in enumerate(records.stations)
+    }
+    return season_sums.tolist(), season_counts.tolist(), stats
+
+def compute_partial(records):
+    # Season sums/counts (indexed like SEASON_NAMES) and per-station Welford state, in one pass
+    if USE_PANDAS:
+        return compute_partial_np(records)
+    season_sums = [0.0] * len(SEASON_NAMES)
+    season_counts = [0] * len(SEASON_NAMES)
+    stats = [None] * len(records.stations)  # per station id: [count, mean, M2, tmin, tmax]
+    for sid, month, temp in zip(records.station_ids, records.months, records.temps):
+        i = MONTH_TO_SEASON[month]
+        season_sums[i] += temp
+        season_counts[i] += 1
+        s = stats[sid]
+        if s is None:
+            stats[sid] = [1, temp, 0.0, temp, temp]
+        else:
+            update_welford(s, temp)
+    return season_sums, season_counts, dict(zip(records.stations, stats))
+
+def finish_stats(season_sums, season_counts, stats):
+    # Turn (merged) partials into (avg_by_season, range_info, std_info)
+    avg_by_season = {
+        season: season_sums[i] / season_counts[i] for i, season in enumerate(SEASON_NAMES) if season_counts[i]
+    }
+    range_info, std_info = summarize_stations(stats)
+    return avg_by_season, range_info, std_info
+
+def compute_all(records):
+    # Seasonal averages and per-station stats fused into a single pass over records
+    return finish_stats(*compute_partial(records))
+
+def partial_agg(path):
+    # Worker for aggregate_files: reduce one file to its partials so only O(stations) data
+    # is pickled back; errors are returned so the parent reports them in file order
+    try:
+        cols = read_rows_with_pandas(path) if USE_PANDAS else read_rows_with_csv(path)
+        records = make_records([cols] if len(cols[2]) else [])
+        return len(records.temps), compute_partial(records), None
+    except Exception as e:
+        return 0, None, str(e)
+
+def aggregate_files():
+    # Map-reduce over the CSV files: per-file partials from worker processes, merged here.
+    # Returns (record count, season_sums, season_counts, stats)
+    season_sums = [0.0] * len(SEASON_NAMES)
+    season_counts = [0] * len(SEASON_NAMES)
+    stats = {}
+    total = 0
+    if not os.path.isdir(TEMP_DIR):
+        print(f"Directory not found: {TEMP_DIR}")
+        return total, season_sums, season_counts, stats
+    files = [os.path.join(TEMP_DIR, f) for f in os.listdir(TEMP_DIR) if f.lower().endswith(".csv")]
+    files.sort()
+    print(f"Found {len(files)} CSV files in {TEMP_DIR}")
+    if not files:
+        return total, season_sums, season_counts, stats
+    with ProcessPoolExecutor(max_workers=min(len(files), os.cpu_count() or 1)) as ex:
+        for path, (n, part, err) in zip(files, ex.map(partial_agg, files)):
+            if err is not None:
+                print(f"  Error reading {os.path.basename(path)}: {err}")
+                continue
+            print(f"  {os.path.basename(path)}: {n} records")
+            total += n
+            part_sums, part_counts, part_stats = part
+            for i in range(len(SEASON_NAMES)):
+                season_sums[i] += part_sums[i]
+                season_counts[i] += part_counts[i]
+            for st, s in part_stats.items():
+                stats[st] = merge_welford(stats[st], s) if st in stats else s
+    return total, season_sums, season_counts, stats
+
+def format_seasonal_average(avg_by_season):
+    return "\n".join(
+        f"{season}: {format_celsius(avg_by_season[season])}" for season in SEASON_NAMES if season in avg_by_season
+    )
+
+def format_largest_range(range_info):
     if not range_info:
-        with open(OUT_RANGE, "w", encoding="utf-8") as f:
-            f.write("")
-        return
+        return ""
     max_range = max(r for r, _, _ in range_info.values())
-    winners = [st for st, (r, _, _) in range_info.items() if abs(r - max_range) < 1e-12]
-    winners.sort()
+    winners = sorted(st for st, (r, _, _) in range_info.items() if abs(r - max_range) < TIE_TOL)
     lines = []
     for st in winners:
         r, tmax, tmin = range_info[st]
         lines.append(f"{st}: Range {format_celsius(r)} (Max: {format_celsius(tmax)}, Min: {format_celsius(tmin)})")
-    with open(OUT_RANGE, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+    return "\n".join(lines)
 
-def write_stability(std_info):
+def format_stability(std_info):
     if not std_info:
-        with open(OUT_STAB, "w", encoding="utf-8") as f:
-            f.write("")
-        return
+        return ""
     min_std = min(std_info.values())
     max_std = max(std_info.values())
 
-    most_stable = sorted([st for st, s in std_info.items() if abs(s - min_std) < 1e-12])
-    most_variable = sorted([st for st, s in std_info.items() if abs(s - max_std) < 1e-12])
+    most_stable = sorted([st for st, s in std_info.items() if abs(s - min_std) < TIE_TOL])
+    most_variable = sorted([st for st, s in std_info.items() if abs(s - max_std) < TIE_TOL])
 
     stable_names = ", ".join(most_stable)
     variable_names = ", ".join(most_variable)
 
-    lines = [
-        f"Most Stable: {stable_names}: StdDev {format_celsius(min_std)}",
-        f"Most Variable: {variable_names}: StdDev {format_celsius(max_std)}",
+    return (
+        f"Most Stable: {stable_names}: StdDev {format_celsius(min_std)}\n"
+        f"Most Variable: {variable_names}: StdDev {format_celsius(max_std)}"
+    )
+
+def write_outputs(avg_by_season, range_info, std_info, fsync=False):
+    # Each output is built in full and written with a single buffered write
+    outputs = [
+        (OUT_AVG, format_seasonal_average(avg_by_season)),
+        (OUT_RANGE, format_largest_range(range_info)),
+        (OUT_STAB, format_stability(std_info)),
     ]
-    with open(OUT_STAB, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+    for path, text in outputs:
+        with open(path, "w", buffering=1 << 16, encoding="utf-8", newline="\n") as f:
+            f.write(text)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
 
 def main():
-    records = load_all_records()
-    if not records:
+    total, season_sums, season_counts, stats = aggregate_files()
+    if total == 0:
         # Ensure outputs exist, even if empty
-        open(OUT_AVG, "w", encoding="utf-8").close()
-        open(OUT_RANGE, "w", encoding="utf-8").close()
-        open(OUT_STAB, "w", encoding="utf-8").close()
+        write_outputs({}, {}, {})
         print("No records loaded. Check 'temperatures' folder and CSV headers (temp/date or month).")
         return
 
-    print(f"Total records loaded: {len(records)}")
-    avg_by_season = compute_seasonal_average(records)
-    _, range_info, std_info = compute_station_stats(records)
+    print(f"Total records loaded: {total}")
+    avg_by_season, range_info, std_info = finish_stats(season_sums, season_counts, stats)
 
-    write_seasonal_average(avg_by_season)
-    write_largest_range(range_info)
-    write_stability(std_info)
+    write_outputs(avg_by_season, range_info, std_info)
     print("Analysis complete. Check output files.")
 
 if __name__ == "__main__":